@@ -7,6 +7,7 @@ Architecture:
   - Constants / config at the top
   - API layer: token fetching, Spotify search, iTunes search, image download
   - Parsing layer: text input and CSV input parsing
+  - Assets: cached stylesheet loading
   - UI layer: sidebar, input tabs, results gallery, download controls
 
 Author: Rosalie Cabison | Music & Tech PM
@@ -15,9 +16,30 @@ Author: Rosalie Cabison | Music & Tech PM
 import streamlit as st
 import requests
 import pandas as pd
+import numpy as np
+import hashlib
 import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from itertools import chain
 from typing import Optional
 
+from diskcache import Cache
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from urllib3.exceptions import InvalidHeader, MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+from artwork_types import ArtworkResult
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up — falls back to the stdlib decoder
+    orjson = None
+
 # ============================================
 # CONSTANTS
 # ============================================
@@ -27,42 +49,231 @@ ITUNES_ARTWORK_PREVIEW_SIZE = "100x100bb"
 SPOTIFY_AUTH_URL = "https://accounts.spotify.com/api/token"
 SPOTIFY_SEARCH_URL = "https://api.spotify.com/v1/search"
 ITUNES_SEARCH_URL = "https://itunes.apple.com/search"
+SEARCH_MAX_WORKERS = 10  # Concurrent entry lookups — kept low to respect API rate limits
+GALLERY_MAX_OPTIONS = 5
+SPOTIFY_PREVIEW_MIN_WIDTH = 300  # Smallest Spotify rendition that still looks sharp in a gallery column
+IMAGE_CHUNK_SIZE = 64 * 1024
+MAX_IMAGE_BYTES = 10_000_000  # 3000×3000 artwork is 1–5 MB; anything bigger is refused
+REQUEST_TIMEOUT = 10  # seconds, applied to every outbound HTTP call
+HTTP_POOL_CONNECTIONS = 20  # Distinct hosts kept warm (Spotify, iTunes, image CDN shards)
+HTTP_POOL_MAXSIZE = 50  # Sockets per host — comfortably above the worker-thread count
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "style.css")
+SPOTIFY_TOKEN_EXPIRY_MARGIN = 60  # seconds — refresh a little before Spotify's stated expiry
+SEARCH_CACHE_TTL = 86400  # seconds — catalogue artwork rarely changes within a day
+SEARCH_CACHE_MAX_ENTRIES = 10000
+IMAGE_CACHE_MAX_ENTRIES = 512
+IMAGE_DISK_CACHE_DIR = os.path.join(tempfile.gettempdir(), "artwork_cache")
+IMAGE_DISK_CACHE_SIZE_LIMIT = 512 << 20  # bytes (512 MiB) — oldest-used artwork is evicted past this
+WARMUP_URLS = (  # Fixed hosts whose DNS + TLS setup is paid once at startup, not on the first search
+    "https://accounts.spotify.com",
+    "https://api.spotify.com",
+    "https://itunes.apple.com",
+    "https://i.scdn.co",
+)
+RETRY_AFTER_MAX = 5  # seconds — longer Retry-After waits surface as an error instead of a stall
+WARMUP_TIMEOUT = 3  # seconds — warm-up is best-effort and must never hold a socket for long
 
 # ============================================
-# TYPE ALIASES
+# TYPES
 # ============================================
-ArtworkResult = dict
 SearchType = str  # "artist" | "track" | "album" | "track_or_album"
+# ArtworkResult lives in artwork_types.py so cached results pickle across script runs
+
+CSV_COLUMNS = ("Artist", "Track", "Album")  # Artist is required; Track and Album are optional
 
 
 # ============================================
 # API LAYER
 # ============================================
 
-@st.cache_data
+class _CappedRetry(Retry):
+    """
+    Retry policy that gives up instead of sleeping when Retry-After exceeds RETRY_AFTER_MAX.
+    urllib3 would otherwise wait out the full header (up to six hours) on each retry,
+    freezing a search worker — or, on the token POST, every user behind the token lock.
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and self.respect_retry_after_header:
+            try:
+                retry_after = self.get_retry_after(response)
+            except InvalidHeader:
+                retry_after = None
+            if retry_after is not None and retry_after > RETRY_AFTER_MAX:
+                # With raise_on_status=False the pool hands back this response as-is
+                raise MaxRetryError(_pool, url, ResponseError(f"Retry-After {retry_after:.0f}s"))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """
+    Shared requests.Session for every Spotify, iTunes, and image CDN call.
+    Keep-alive pooling skips a fresh TCP+TLS handshake per request, and the retry
+    policy backs off on transient 429/5xx responses before callers see an error.
+    Cached as a resource so one session outlives reruns and user sessions.
+    """
+    retry = _CappedRetry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # The token POST is a repeatable client-credentials exchange, so it retries too
+        allowed_methods=frozenset(["GET", "POST"]),
+        respect_retry_after_header=True,
+        # Hand the final response back so raise_for_status still reports the HTTP code
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.headers.update(
+        {
+            "User-Agent": "music-artwork-finder (+https://github.com/yoitsrosalie/music-artwork-finder)",
+            "Accept-Encoding": "gzip",
+        }
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = get_http_session()
+
+
+@st.cache_resource
+def warm_http_connections() -> threading.Thread:
+    """
+    Open a keep-alive connection to each WARMUP_URLS host on a daemon thread, once per
+    process, so the first real search reuses a resolved, handshaken socket.
+    Failures are ignored — the real call will simply connect on its own.
+    """
+    def warm() -> None:
+        for url in WARMUP_URLS:
+            try:
+                SESSION.head(url, timeout=WARMUP_TIMEOUT)
+            except requests.RequestException:
+                pass
+
+    thread = threading.Thread(target=warm, daemon=True)
+    thread.start()
+    return thread
+
+
+warm_http_connections()
+
+
+def _json(response: requests.Response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _spotify_credential_id(client_id: str, client_secret: str) -> str:
+    """Short digest of a credential pair, so shared caches never hold the raw secret."""
+    return hashlib.blake2b(f"{client_id}:{client_secret}".encode(), digest_size=8).hexdigest()
+
+
+@st.cache_resource
+def _spotify_token_store() -> dict:
+    """
+    Process-wide {credential_id: (token, expires_at)} map, with expires_at on the
+    time.monotonic() clock.
+    Makes the token hot path a plain dict lookup instead of a trip through
+    st.cache_data's argument hashing, and unlike a module-level lru_cache it
+    survives Streamlit re-executing this script on every rerun.
+    """
+    return {}
+
+
+@st.cache_resource
+def _spotify_token_lock() -> threading.Lock:
+    """Serialises token refreshes so concurrent search workers share one exchange."""
+    return threading.Lock()
+
+
 def fetch_spotify_token(client_id: str, client_secret: str) -> Optional[str]:
     """
     Exchange Spotify client credentials for a bearer token.
     Returns None and surfaces a user-visible warning on failure.
-    Cached so the token is reused across reruns within the same session.
+    Tokens are reused until shortly before the expiry Spotify reports; failures are
+    never stored, so corrected credentials take effect on the next call.
     """
     try:
-        response = requests.post(
+        return _get_spotify_token(client_id, client_secret)
+    except requests.HTTPError as e:
+        st.warning(f"Spotify auth failed (HTTP {e.response.status_code}). Check your credentials.")
+        return None
+    except Exception as e:
+        st.warning(f"Spotify auth failed: {e}")
+        return None
+
+
+def _get_spotify_token(client_id: str, client_secret: str) -> str:
+    """Core of fetch_spotify_token: serve the stored token or request a new one, raising on failure."""
+    token_store = _spotify_token_store()
+    cache_key = _spotify_credential_id(client_id, client_secret)
+
+    cached = token_store.get(cache_key)
+    if cached and time.monotonic() < cached[1]:
+        return cached[0]
+
+    with _spotify_token_lock():
+        # Another worker may have refreshed the token while this one waited
+        cached = token_store.get(cache_key)
+        if cached and time.monotonic() < cached[1]:
+            return cached[0]
+
+        response = SESSION.post(
             SPOTIFY_AUTH_URL,
             data={
                 "grant_type": "client_credentials",
                 "client_id": client_id,
                 "client_secret": client_secret,
             },
+            timeout=REQUEST_TIMEOUT,
         )
         response.raise_for_status()
-        return response.json()["access_token"]
-    except requests.HTTPError as e:
-        st.warning(f"Spotify auth failed (HTTP {e.response.status_code}). Check your credentials.")
-        return None
-    except Exception as e:
-        st.warning(f"Spotify auth failed: {e}")
-        return None
+        payload = _json(response)
+        token = payload["access_token"]
+
+        expires_at = time.monotonic() + payload.get("expires_in", 3600) - SPOTIFY_TOKEN_EXPIRY_MARGIN
+        token_store[cache_key] = (token, expires_at)
+        return token
+
+
+def prefetch_spotify_token(client_id: str, client_secret: str) -> None:
+    """
+    Warm the token store on a daemon thread while the user is still filling in entries,
+    so the first search skips the auth round-trip. Errors are dropped here and reported
+    by the real fetch when a search runs.
+    """
+    def warm() -> None:
+        try:
+            _get_spotify_token(client_id, client_secret)
+        except Exception:
+            pass
+
+    thread = threading.Thread(target=warm, daemon=True)
+    add_script_run_ctx(thread)
+    thread.start()
+
+
+def invalidate_spotify_token(client_id: str, client_secret: str, failed_token: str) -> None:
+    """
+    Drop the stored token for these credentials so the next call fetches a fresh one.
+    Only removes it if it is still the token that failed: when several workers see a 401
+    at once, a late one must not discard the replacement another worker already stored.
+    """
+    token_store = _spotify_token_store()
+    cache_key = _spotify_credential_id(client_id, client_secret)
+    with _spotify_token_lock():
+        cached = token_store.get(cache_key)
+        if cached and cached[0] == failed_token:
+            del token_store[cache_key]
 
 
 def search_spotify(
@@ -72,136 +283,186 @@ def search_spotify(
     client_secret: str,
     search_type: SearchType = "track_or_album",
     album: str = "",
-) -> list[ArtworkResult]:
+) -> tuple[list[ArtworkResult], bool]:
     """
     Search Spotify for artwork matching the given artist/track/album.
-    Returns an empty list on any failure so callers don't need try/except.
+    Returns (results, errored). Failures surface as a warning and an empty list, so
+    callers don't need try/except; errored tells a failed lookup apart from no matches.
     """
     token = fetch_spotify_token(client_id, client_secret)
     if not token:
-        return []
-
-    headers = {"Authorization": f"Bearer {token}"}
+        return [], True
 
     try:
-        if search_type == "artist":
-            return _spotify_artist_search(artist, headers)
-        elif search_type == "album":
-            return _spotify_album_search(artist, album, headers)
-        else:
-            return _spotify_track_search(artist, track, headers)
-
+        try:
+            return _cached_spotify_search(artist, track, album, search_type, client_id, client_secret), False
+        except requests.HTTPError as e:
+            # Spotify can revoke a token before its reported expiry; refresh it and retry once
+            if e.response is None or e.response.status_code != 401:
+                raise
+            invalidate_spotify_token(client_id, client_secret, token)
+            if not fetch_spotify_token(client_id, client_secret):
+                return [], True
+            return _cached_spotify_search(artist, track, album, search_type, client_id, client_secret), False
     except requests.HTTPError as e:
         st.warning(f"Spotify search failed (HTTP {e.response.status_code}) for '{artist} - {track}'.")
-        return []
+        return [], True
     except Exception as e:
         st.warning(f"Spotify search error for '{artist} - {track}': {e}")
-        return []
+        return [], True
+
+
+@st.cache_data(ttl=SEARCH_CACHE_TTL, max_entries=SEARCH_CACHE_MAX_ENTRIES, show_spinner=False)
+def _cached_spotify_search(
+    artist: str,
+    track: str,
+    album: str,
+    search_type: SearchType,
+    client_id: str,
+    client_secret: str,
+) -> list[ArtworkResult]:
+    """
+    Cached core of search_spotify.
+    Lets HTTP errors propagate so failed lookups are never cached.
+    """
+    token = fetch_spotify_token(client_id, client_secret)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    if search_type == "artist":
+        return _spotify_artist_search(artist, headers)
+    elif search_type == "album":
+        return _spotify_album_search(artist, album, headers)
+    else:
+        return _spotify_track_search(artist, track, headers)
+
+
+def _spotify_image_fields(images: list[dict]) -> dict:
+    """
+    Pick image fields for a Spotify result: the largest rendition for download and the
+    smallest one at least SPOTIFY_PREVIEW_MIN_WIDTH wide for the gallery thumbnail.
+    """
+    largest = images[0]  # Spotify lists images widest first
+    preview = min(
+        (img for img in images if (img.get("width") or 0) >= SPOTIFY_PREVIEW_MIN_WIDTH),
+        key=lambda img: img["width"],
+        default=largest,
+    )
+    return {
+        "image_url": largest["url"],
+        "preview_url": preview["url"],
+        "width": largest["width"],
+        "height": largest["height"],
+    }
 
 
 def _spotify_artist_search(artist: str, headers: dict) -> list[ArtworkResult]:
-    """Return artist photo results from Spotify. Only exact name matches are kept."""
-    response = requests.get(
+    """
+    Return the artist photo result from Spotify.
+    The quoted query pushes exact-name matching to Spotify's ranking, so only the top
+    hit is fetched; the lowercase comparison is kept as a guard against near-misses.
+    Spotify's query syntax can't escape a quote inside a phrase, so names containing
+    one (e.g. '"Weird Al" Yankovic') fall back to an unquoted filter over a few hits.
+    """
+    if '"' in artist:
+        unquoted = artist.replace('"', "")
+        params = {"q": f"artist:{unquoted}", "type": "artist", "limit": 5}
+    else:
+        params = {"q": f'artist:"{artist}"', "type": "artist", "limit": 1}
+
+    response = SESSION.get(
         SPOTIFY_SEARCH_URL,
         headers=headers,
-        params={"q": f"artist:{artist}", "type": "artist", "limit": 5},
+        params=params,
+        timeout=REQUEST_TIMEOUT,
     )
     response.raise_for_status()
-    artists = response.json()["artists"]["items"]
+    artists = _json(response)["artists"]["items"]
+    artist_lower = artist.lower()
 
     return [
-        {
-            "source": "Spotify",
-            "image_url": item["images"][0]["url"],
-            "width": item["images"][0]["width"],
-            "height": item["images"][0]["height"],
-            "artist_name": item["name"],
-            "album_name": item["name"],
-            "type": "Artist Photo",
-            "found": True,
-        }
+        ArtworkResult(
+            source="Spotify",
+            **_spotify_image_fields(item["images"]),
+            artist_name=item["name"],
+            album_name=item["name"],
+            type="Artist Photo",
+            found=True,
+        )
         for item in artists
-        if item["name"].lower() == artist.lower() and item["images"]
+        if item["name"].lower() == artist_lower and item["images"]
     ]
 
 
 def _spotify_album_search(artist: str, album: str, headers: dict) -> list[ArtworkResult]:
     """Return album artwork results from Spotify for a specific album."""
-    response = requests.get(
+    response = SESSION.get(
         SPOTIFY_SEARCH_URL,
         headers=headers,
         params={"q": f"artist:{artist} album:{album}", "type": "album", "limit": 5},
+        timeout=REQUEST_TIMEOUT,
     )
     response.raise_for_status()
-    albums = response.json()["albums"]["items"]
+    albums = _json(response)["albums"]["items"]
 
     return [
-        {
-            "source": "Spotify",
-            "image_url": item["images"][0]["url"],
-            "width": item["images"][0]["width"],
-            "height": item["images"][0]["height"],
-            "album_name": item["name"],
-            "type": "Single" if item.get("album_type") == "single" else "Album",
-            "found": True,
-        }
+        ArtworkResult(
+            source="Spotify",
+            **_spotify_image_fields(item["images"]),
+            album_name=item["name"],
+            type="Single" if item.get("album_type") == "single" else "Album",
+            found=True,
+        )
         for item in albums
         if item["images"]
     ]
 
 
 def _spotify_track_search(artist: str, track: str, headers: dict) -> list[ArtworkResult]:
-    results = []
-    seen = set()
-
     # Query 1: search by track name
-    track_response = requests.get(
+    track_response = SESSION.get(
         SPOTIFY_SEARCH_URL,
         headers=headers,
         params={"q": f"artist:{artist} track:{track}", "type": "track", "limit": 5},
+        timeout=REQUEST_TIMEOUT,
     )
     track_response.raise_for_status()
-    for item in track_response.json().get("tracks", {}).get("items", []):
-        album = item.get("album", {})
-        if album.get("images"):
-            url = album["images"][0]["url"]
-            if url not in seen:
-                seen.add(url)
-                results.append({
-                    "source": "Spotify",
-                    "image_url": url,
-                    "width": album["images"][0]["width"],
-                    "height": album["images"][0]["height"],
-                    "album_name": album["name"],
-                    "track_name": item["name"],
-                    "type": "Single" if album.get("album_type") == "single" else "Album",
-                    "found": True,
-                })
 
     # Query 2: search by album name
-    album_response = requests.get(
+    album_response = SESSION.get(
         SPOTIFY_SEARCH_URL,
         headers=headers,
         params={"q": f"artist:{artist} album:{track}", "type": "album", "limit": 5},
+        timeout=REQUEST_TIMEOUT,
     )
     album_response.raise_for_status()
-    for item in album_response.json().get("albums", {}).get("items", []):
-        if item.get("images"):
-            url = item["images"][0]["url"]
-            if url not in seen:
-                seen.add(url)
-                results.append({
-                    "source": "Spotify",
-                    "image_url": url,
-                    "width": item["images"][0]["width"],
-                    "height": item["images"][0]["height"],
-                    "album_name": item["name"],
-                    "track_name": "",
-                    "type": "Single" if item.get("album_type") == "single" else "Album",
-                    "found": True,
-                })
-
-    return results
+
+    # Both responses reduce to (album, track_name) pairs, so one loop builds every result
+    candidates = chain(
+        (
+            (item.get("album", {}), item["name"])
+            for item in _json(track_response).get("tracks", {}).get("items", [])
+        ),
+        (
+            (item, "")
+            for item in _json(album_response).get("albums", {}).get("items", [])
+        ),
+    )
+
+    # Keyed by image URL: one structure handles both dedup and insertion order
+    results: dict[str, ArtworkResult] = {}
+    for album, track_name in candidates:
+        images = album.get("images")
+        if images and images[0]["url"] not in results:
+            results[images[0]["url"]] = ArtworkResult(
+                source="Spotify",
+                **_spotify_image_fields(images),
+                album_name=album["name"],
+                track_name=track_name,
+                type="Single" if album.get("album_type") == "single" else "Album",
+                found=True,
+            )
+
+    return list(results.values())
   
 
 def search_itunes(
@@ -209,78 +470,163 @@ def search_itunes(
     track: str = "",
     album: str = "",
     search_type: SearchType = "track_or_album",
-) -> list[ArtworkResult]:
+) -> tuple[list[ArtworkResult], bool]:
     """
     Search the iTunes API for artwork.
 
-    For track_or_album searches, makes two requests — one for tracks and one for
-    albums — then merges and deduplicates by image URL. iTunes does not support
+    For track_or_album searches, makes two concurrent requests — one for tracks and
+    one for albums — then merges and deduplicates by image URL. iTunes does not support
     mixed entity types in a single call, so two calls are required to honour the
     "both are searched" promise in the UI.
 
-    Returns a list of result dicts (empty on failure).
+    Returns (results, errored): errored is set when any lookup failed, even if the
+    other one still produced results.
     """
     if search_type == "artist":
         param_sets = [
-            {"term": artist, "entity": "album", "limit": 5, "sort": "popular"}
+            {"term": _itunes_term(artist), "entity": "album", "limit": 5, "sort": "popular"}
         ]
     elif search_type == "album":
         query_title = album if album else track
         param_sets = [
-            {"term": f"{artist} {query_title}", "entity": "album", "limit": 5}
+            {"term": _itunes_term(artist, query_title), "entity": "album", "limit": 5}
         ]
     else:
         # track_or_album: query both entity types and merge
+        term = _itunes_term(artist, track)
         param_sets = [
-            {"term": f"{artist} {track}", "entity": "musicTrack", "limit": 5},
-            {"term": f"{artist} {track}", "entity": "album", "limit": 5},
+            {"term": term, "entity": "musicTrack", "limit": 5},
+            {"term": term, "entity": "album", "limit": 5},
         ]
 
+    # Multiple lookups are independent, so issue them side by side; results are read back
+    # in submission order so track hits still rank ahead of album hits. A single lookup
+    # runs inline rather than on a throwaway thread inside this search worker.
+    if len(param_sets) > 1:
+        with _script_thread_pool(len(param_sets)) as pool:
+            futures = [pool.submit(_itunes_query, params) for params in param_sets]
+        lookups = [future.result for future in futures]
+    else:
+        lookups = [partial(_itunes_query, param_sets[0])]
+
     raw_results = []
-    for params in param_sets:
+    errored = False
+    for lookup in lookups:
         try:
-            response = requests.get(ITUNES_SEARCH_URL, params=params, timeout=10)
-            response.raise_for_status()
-            raw_results.extend(response.json().get("results", []))
+            raw_results.extend(lookup())
         except requests.HTTPError as e:
             st.warning(f"iTunes search failed (HTTP {e.response.status_code}) for '{artist} - {track}'.")
+            errored = True
         except Exception as e:
             st.warning(f"iTunes search error for '{artist} - {track}': {e}")
+            errored = True
 
-    results = []
-    seen_urls = set()
+    # Keyed by preview URL: one structure handles both dedup and insertion order
+    results: dict[str, ArtworkResult] = {}
 
     for item in raw_results:
         preview_url = item.get("artworkUrl100", "")
         if not preview_url:
             continue
-        full_res_url = preview_url.replace(ITUNES_ARTWORK_PREVIEW_SIZE, ITUNES_ARTWORK_SIZE)
 
-        # Deduplicate by full-res URL — track and album calls often return the same artwork
-        if full_res_url in seen_urls:
+        # Deduplicate by artwork URL — track and album calls often return the same artwork.
+        # Preview and full-res URLs map 1:1, so this skips the rewrite for duplicates.
+        if preview_url in results:
             continue
-        seen_urls.add(full_res_url)
+        full_res_url = _itunes_full_res_url(preview_url)
 
         collection_name = item.get("collectionName", "").lower()
         track_name_lower = item.get("trackName", "").lower()
-        is_single = "single" in collection_name or track_name_lower == collection_name
+        # Cheap equality first; the substring scan only runs when it fails
+        is_single = track_name_lower == collection_name or "single" in collection_name
         result_type = "Single" if is_single else "Album"
 
-        results.append({
-            "source": "iTunes",
-            "image_url": full_res_url,
-            "preview_url": preview_url,
-            "album_name": item.get("collectionName", "Unknown"),
-            "artist_name": item.get("artistName", artist),
-            "track_name": item.get("trackName", ""),
-            "type": result_type,
-            "found": True,
-        })
+        results[preview_url] = ArtworkResult(
+            source="iTunes",
+            image_url=full_res_url,
+            preview_url=preview_url,
+            album_name=item.get("collectionName", "Unknown"),
+            artist_name=item.get("artistName", artist),
+            track_name=item.get("trackName", ""),
+            type=result_type,
+            found=True,
+        )
+
+    return list(results.values()), errored
+
+
+def _itunes_term(*parts: str) -> str:
+    """
+    Canonical iTunes search term: lowercased with whitespace collapsed.
+    iTunes matching ignores case and spacing, so this only changes the _itunes_query
+    cache key — "Taylor Swift  Midnights" and "taylor swift midnights" share one entry.
+    """
+    return " ".join(" ".join(parts).lower().split())
+
 
-    return results
+def _itunes_full_res_url(preview_url: str) -> str:
+    """Swap the trailing size segment of an iTunes artwork URL (…/100x100bb.jpg) for full-res."""
+    head, sep, tail = preview_url.rpartition(ITUNES_ARTWORK_PREVIEW_SIZE)
+    return f"{head}{ITUNES_ARTWORK_SIZE}{tail}" if sep else preview_url
+
+
+@st.cache_data(ttl=SEARCH_CACHE_TTL, max_entries=SEARCH_CACHE_MAX_ENTRIES, show_spinner=False)
+def _itunes_query(params: dict) -> list[dict]:
+    """
+    Run a single iTunes Search API request and return its raw result items.
+    Lets HTTP errors propagate so failed lookups are never cached.
+    """
+    response = SESSION.get(ITUNES_SEARCH_URL, params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return _json(response).get("results", [])
+
+
+@st.cache_resource
+def get_image_disk_cache() -> Cache:
+    """
+    Disk-backed LRU of artwork bytes shared by every session.
+    Unlike the in-process caches it survives server restarts and redeploys, so
+    re-downloading the same artwork after a restart skips the CDN.
+    """
+    return Cache(
+        IMAGE_DISK_CACHE_DIR,
+        size_limit=IMAGE_DISK_CACHE_SIZE_LIMIT,
+        eviction_policy="least-recently-used",
+    )
+
+
+# Artwork bytes for a URL never change and bytes are immutable, so a resource cache
+# hands back the same object instead of st.cache_data's per-hit pickle copy.
+@st.cache_resource(max_entries=IMAGE_CACHE_MAX_ENTRIES, show_spinner=False)
+def _fetch_image(url: str) -> bytes:
+    """
+    Download image bytes from a URL, checking the on-disk cache first.
+    Streams the body in chunks so a multi-MB JPEG is never held twice while downloading,
+    and refuses bodies over MAX_IMAGE_BYTES — up front when Content-Length says so,
+    otherwise as soon as the stream crosses the limit.
+    Lets errors propagate so failed downloads are never cached.
+    """
+    disk_cache = get_image_disk_cache()
+    cached = disk_cache.get(url)
+    if cached is not None:
+        return cached
+
+    with SESSION.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+        response.raise_for_status()
+        if int(response.headers.get("Content-Length") or 0) > MAX_IMAGE_BYTES:
+            raise ValueError(f"Image larger than {MAX_IMAGE_BYTES} bytes: {url}")
+
+        buffer = bytearray()
+        for chunk in response.iter_content(IMAGE_CHUNK_SIZE):
+            buffer.extend(chunk)
+            if len(buffer) > MAX_IMAGE_BYTES:
+                raise ValueError(f"Image larger than {MAX_IMAGE_BYTES} bytes: {url}")
+
+    image_bytes = bytes(buffer)
+    disk_cache.set(url, image_bytes)
+    return image_bytes
 
 
-@st.cache_data
 def download_image(url: str) -> Optional[bytes]:
     """
     Download image bytes from a URL.
@@ -288,13 +634,118 @@ def download_image(url: str) -> Optional[bytes]:
     Returns None on failure instead of raising.
     """
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.content
+        return _fetch_image(url)
     except Exception:
         return None
 
 
+def _script_thread_pool(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Build a thread pool whose workers are attached to the current script run,
+    so st.warning and st.cache_data keep working from inside worker threads.
+    """
+    ctx = get_script_run_ctx()
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=add_script_run_ctx,
+        initargs=(None, ctx),
+    )
+
+
+def _collapse_entry_spacing(entry: dict) -> dict:
+    """
+    Copy of an entry with runs of whitespace in artist/track/album collapsed to one space.
+    This is what a deduplicated group actually searches with, so the query (and the exact
+    artist-name check) matches the group's key rather than one row's stray spacing.
+    """
+    return {
+        **entry,
+        **{field: " ".join(entry.get(field, "").split()) for field in ("artist", "track", "album")},
+    }
+
+
+def _entry_query_key(entry: dict) -> tuple:
+    """
+    Identity of an entry's lookup, ignoring case and spacing.
+    Both APIs match case-insensitively, so entries that only differ in those share one search.
+    """
+    collapsed = _collapse_entry_spacing(entry)
+    return (entry["search_type"],) + tuple(
+        collapsed[field].lower() for field in ("artist", "track", "album")
+    )
+
+
+def _with_entry_labels(result: dict, entry: dict) -> dict:
+    """
+    Copy of a shared search result row, labelled with this entry's own spelling.
+    The download filename stem is derived here, once per search, rather than on every
+    gallery rerun.
+    """
+    track_part = entry["track"] or "artist_photo"
+    return {
+        **result,
+        "artist": entry["artist"],
+        "track": entry["track"],
+        "album": entry.get("album", ""),
+        "filename_stem": f"{entry['artist']}_{track_part}".replace("/", "_"),
+    }
+
+
+def search_entry(
+    entry: dict,
+    client_id: str,
+    client_secret: str,
+    spotify_enabled: bool,
+    always_query_both: bool = False,
+) -> dict:
+    """
+    Run the Spotify and iTunes lookups for one parsed entry and build its result row.
+    iTunes is only a fallback when Spotify has matches, so it is skipped in that case
+    unless always_query_both is set.
+    Both searches swallow their own errors, so this is safe to fan out across threads;
+    "errored" on the row records whether either of them failed.
+    """
+    spotify_results, spotify_errored = (
+        search_spotify(
+            entry["artist"],
+            entry["track"],
+            client_id,
+            client_secret,
+            entry["search_type"],
+            entry.get("album", ""),
+        )
+        if spotify_enabled
+        else ([], False)
+    )
+
+    itunes_results, itunes_errored = (
+        search_itunes(
+            entry["artist"],
+            entry["track"],
+            entry.get("album", ""),
+            entry["search_type"],
+        )
+        if always_query_both or not spotify_results
+        else ([], False)
+    )
+
+    combined_options = spotify_results or itunes_results
+    best_result = combined_options[0] if combined_options else None
+
+    return {
+        "artist": entry["artist"],
+        "track": entry["track"],
+        "album": entry.get("album", ""),
+        "spotify_results": spotify_results,
+        "itunes_results": itunes_results,
+        "errored": spotify_errored or itunes_errored,
+        "best_result": best_result,
+        "options": combined_options,
+        # Gallery captions, built once here instead of on every fragment rerun
+        "option_captions": [f"{option.album_name[:25]}..." for option in combined_options],
+    }
+
+
 # ============================================
 # PARSING LAYER
 # ============================================
@@ -307,27 +758,23 @@ def parse_text_entries(raw_text: str) -> list[dict]:
       "Artist"                  → artist photo search
       "Artist - Song or Album"  → track_or_album search
     """
-    entries = []
-    for line in raw_text.strip().splitlines():
-        line = line.strip()
-        if not line:
-            continue
+    # One vectorized pandas pass instead of a per-line Python loop, for large pastes
+    lines = pd.Series(raw_text.splitlines(), dtype=str).str.strip()
+    lines = lines[lines != ""]
+    if lines.empty:
+        return []
 
-        if " - " not in line:
-            entries.append(
-                {"artist": line, "track": "", "album": "", "search_type": "artist"}
-            )
-        else:
-            artist, title = line.split(" - ", maxsplit=1)
-            entries.append(
-                {
-                    "artist": artist.strip(),
-                    "track": title.strip(),
-                    "album": title.strip(),
-                    "search_type": "track_or_album",
-                }
-            )
-    return entries
+    parts = lines.str.split(" - ", n=1, expand=True).reindex(columns=[0, 1])
+    title = parts[1].fillna("").str.strip()
+
+    return pd.DataFrame(
+        {
+            "artist": parts[0].str.strip(),
+            "track": title,
+            "album": title,
+            "search_type": np.where(parts[1].isna(), "artist", "track_or_album"),
+        }
+    ).to_dict(orient="records")
 
 
 def parse_csv_entries(uploaded_file) -> list[dict]:
@@ -336,7 +783,15 @@ def parse_csv_entries(uploaded_file) -> list[dict]:
     Required column: Artist. Optional columns: Track, Album.
     """
     try:
-        df = pd.read_csv(uploaded_file)
+        # Only the known columns are parsed; anything else in the sheet is skipped.
+        # The C engine is kept deliberately: pyarrow infers numeric/boolean types before
+        # dtype=str applies, turning "007" into "7" and "true" into "True".
+        df = pd.read_csv(
+            uploaded_file,
+            usecols=lambda col: col in CSV_COLUMNS,
+            dtype=str,
+            keep_default_na=False,
+        )
     except Exception as e:
         st.error(f"Could not read CSV: {e}")
         return []
@@ -345,21 +800,25 @@ def parse_csv_entries(uploaded_file) -> list[dict]:
         st.error("CSV must include an 'Artist' column.")
         return []
 
-    entries = []
-    for _, row in df.iterrows():
-        artist = str(row.get("Artist", "")).strip()
-        track = str(row.get("Track", "")).strip()
-        album = str(row.get("Album", "")).strip()
+    # Column-wise string ops instead of iterrows, which boxes every row into a Series
+    df = df.reindex(columns=list(CSV_COLUMNS), fill_value="")
+    df = df.apply(lambda col: col.str.strip())
+    df["search_type"] = np.where(df["Track"].eq(""), "artist", "track_or_album")
 
-        track = "" if track == "nan" else track
-        album = "" if album == "nan" else album
+    return df.rename(
+        columns={"Artist": "artist", "Track": "track", "Album": "album"}
+    ).to_dict(orient="records")
 
-        search_type = "artist" if not track else "track_or_album"
-        entries.append(
-            {"artist": artist, "track": track, "album": album, "search_type": search_type}
-        )
 
-    return entries
+# ============================================
+# ASSETS
+# ============================================
+
+@st.cache_resource
+def load_stylesheet(path: str) -> str:
+    """Read the app stylesheet once per process instead of from disk on every rerun."""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
 
 
 # ============================================
@@ -385,26 +844,9 @@ st.markdown(
 )
 st.divider()
 
-st.markdown(
-    """
-    <style>
-    [data-testid="stFullScreenFrame"] button,
-    [data-testid="stImage"] button {
-        position: absolute !important;
-        top: 50% !important; left: 50% !important;
-        transform: translate(-50%, -50%) !important;
-        width: 44px !important; height: 44px !important;
-        background: rgba(255,255,255,0.15) !important;
-        backdrop-filter: blur(4px) !important;
-        border-radius: 50% !important;
-        border: 1.5px solid rgba(255,255,255,0.4) !important;
-        opacity: 0; transition: opacity 0.2s ease;
-    }
-    [data-testid="stImage"]:hover button { opacity: 1 !important; }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
+# Streamlit drops any element a rerun doesn't re-emit, so the <style> tag is still
+# written every run — only the file read is cached.
+st.markdown(f"<style>{load_stylesheet(STYLESHEET_PATH)}</style>", unsafe_allow_html=True)
 
 # ============================================
 # SIDEBAR
@@ -429,12 +871,19 @@ with st.sidebar:
             type="password",
         )
 
+    always_query_both = st.checkbox(
+        "Always query both sources",
+        value=False,
+        help="By default iTunes is only searched when Spotify finds nothing. "
+        "Enable to search both for every entry.",
+    )
+
     with st.expander("ℹ️ About This Tool", expanded=False):
         st.markdown(
             "Helps music industry professionals find and download artwork quickly.\n\n"
             "- Searches Spotify and iTunes for each entry (Spotify preferred, iTunes as fallback)\n"
             "- Bulk processing via text or CSV\n"
-            "- One-click download per image result\n"
+            "- Prepare, then download, any image result (full-res is fetched only when you ask)\n"
             "- High-res artwork (up to 3000×3000px)"
         )
 
@@ -448,12 +897,32 @@ with st.sidebar:
             "❌ Derivative works"
         )
 
+    if st.button("🧹 Clear Cached Results", use_container_width=True):
+        st.cache_data.clear()
+        _fetch_image.clear()
+        st.session_state.pop("query_memo", None)
+        st.toast("Cache cleared — the next search will hit Spotify and iTunes fresh.")
+
+    if st.button("🗑️ Clear Image Cache", use_container_width=True):
+        # The disk tier outlives restarts, so the result cache button leaves it alone
+        get_image_disk_cache().clear()
+        _fetch_image.clear()
+        st.session_state.pop("prepared_images", None)
+        st.toast("Image cache cleared — artwork will be downloaded fresh.")
+
 # ============================================
 # INPUT SECTION
 # ============================================
 
 spotify_enabled = bool(spotify_client_id and spotify_client_secret)
 
+# Start the token request once per credential pair, as soon as both fields are filled
+if spotify_enabled:
+    credential_id = _spotify_credential_id(spotify_client_id, spotify_client_secret)
+    if st.session_state.get("prefetched_token_for") != credential_id:
+        st.session_state["prefetched_token_for"] = credential_id
+        prefetch_spotify_token(spotify_client_id, spotify_client_secret)
+
 if not spotify_enabled:
     st.info(
         "ℹ️ Running in iTunes-only mode. Add Spotify credentials in the sidebar for better results "
@@ -496,94 +965,135 @@ if entries:
 # ============================================
 
 if st.button("🔍 Search for Artwork", type="primary", disabled=not entries):
-    results = []
+    results = [None] * len(entries)
     progress_bar = st.progress(0)
     status_placeholder = st.empty()
 
+    # Duplicate rows (common in CSVs, often with stray casing) only need one lookup —
+    # group them by normalized query and fan the shared options back out to every
+    # matching index, each row keeping its own artist/track labels.
+    unique_queries: dict[tuple, list[int]] = {}
     for i, entry in enumerate(entries):
-        display_label = (
-            f"{entry['artist']} — {entry['track']}"
-            if entry["track"]
-            else f"{entry['artist']} (artist photo)"
-        )
-        status_placeholder.text(f"Searching {i + 1}/{len(entries)}: {display_label}")
-
-        spotify_results = (
-            search_spotify(
-                entry["artist"],
-                entry["track"],
+        unique_queries.setdefault(_entry_query_key(entry), []).append(i)
+
+    # Re-running the same batch in this session reuses rows that already found artwork,
+    # without re-hashing arguments into st.cache_data. Misses and rows where either source
+    # errored (e.g. an iTunes fallback after a Spotify 5xx) are never memoized, so a
+    # transient API failure is retried on the next click.
+    query_memo: dict[tuple, dict] = st.session_state.setdefault("query_memo", {})
+    source_key = (
+        _spotify_credential_id(spotify_client_id, spotify_client_secret)
+        if spotify_enabled
+        else None,
+        always_query_both,
+    )
+    pending: dict[tuple, list[int]] = {}
+    for key, indices in unique_queries.items():
+        memo_key = key + source_key
+        if memo_key in query_memo:
+            for i in indices:
+                results[i] = _with_entry_labels(query_memo[memo_key], entries[i])
+        else:
+            pending[memo_key] = indices
+    done = len(entries) - sum(len(indices) for indices in pending.values())
+
+    # Queries are independent and network-bound, so overlap their round-trips
+    # instead of paying N × RTT serially. Results are slotted back by index.
+    with _script_thread_pool(SEARCH_MAX_WORKERS) as pool:
+        futures = {
+            pool.submit(
+                search_entry,
+                _collapse_entry_spacing(entries[indices[0]]),
                 spotify_client_id,
                 spotify_client_secret,
-                entry["search_type"],
-                entry.get("album", ""),
-            )
-            if spotify_enabled
-            else []
-        )
-
-        itunes_results = search_itunes(
-            entry["artist"],
-            entry["track"],
-            entry.get("album", ""),
-            entry["search_type"],
-        )
-
-        combined_options = spotify_results or itunes_results
-        best_result = combined_options[0] if combined_options else None
-
-        results.append(
-            {
-                "artist": entry["artist"],
-                "track": entry["track"],
-                "album": entry.get("album", ""),
-                "spotify_results": spotify_results,
-                "itunes_results": itunes_results,
-                "best_result": best_result,
-                "options": combined_options,
-            }
-        )
+                spotify_enabled,
+                always_query_both,
+            ): (memo_key, indices)
+            for memo_key, indices in pending.items()
+        }
 
-        progress_bar.progress((i + 1) / len(entries))
+        # Each progress/status update is a websocket frame, so cap them at ~100 per batch
+        progress_step = max(1, len(entries) // 100)
+        last_reported = 0
+        for future in as_completed(futures):
+            memo_key, indices = futures[future]
+            result = future.result()
+            if result["best_result"] and not result["errored"]:
+                query_memo[memo_key] = result
+            for i in indices:
+                results[i] = _with_entry_labels(result, entries[i])
+            done += len(indices)
+
+            if done - last_reported >= progress_step or done == len(entries):
+                entry = entries[indices[0]]
+                display_label = (
+                    f"{entry['artist']} — {entry['track']}"
+                    if entry["track"]
+                    else f"{entry['artist']} (artist photo)"
+                )
+                status_placeholder.text(f"Searched {done}/{len(entries)}: {display_label}")
+                progress_bar.progress(done / len(entries))
+                last_reported = done
 
     status_placeholder.empty()
     progress_bar.empty()
 
-    st.session_state["results"] = results
     found = sum(1 for r in results if r["best_result"])
+    # Stored alongside the rows so the summary metrics don't re-scan them on every rerun
+    st.session_state["results"] = results
+    st.session_state["results_found"] = found
     st.success(f"✅ Search complete! Found artwork for {found} of {len(results)} entries.")
 
 # ============================================
 # RESULTS GALLERY
 # ============================================
 
+def _prepare_download(image_url: str) -> None:
+    """Button callback: fetch full-res bytes for one option and keep them for this session."""
+    st.session_state.setdefault("prepared_images", {})[image_url] = download_image(image_url)
+
+
 @st.fragment
 def render_image_options(result_index: int, result: dict, options: list[ArtworkResult]) -> None:
     """
-    Render a row of artwork thumbnails with immediate one-click download buttons.
+    Render a row of artwork thumbnails, each with a download button.
+    Full-res bytes are only fetched once the user asks for an image, so reruns
+    don't push every option's JPEG through the download widgets.
     Wrapped in @st.fragment so only this widget group reruns on interaction,
     not the entire page — critical for performance with many results.
     """
-    num_cols = min(len(options), 5)
+    prepared_images = st.session_state.get("prepared_images", {})
+
+    num_cols = min(len(options), GALLERY_MAX_OPTIONS)
     cols = st.columns(max(num_cols, 3))
 
-    track_part = result.get("track") or "artist_photo"
+    filename_stem = result["filename_stem"]
+    option_captions = result["option_captions"]
 
     for opt_idx, option in enumerate(options[:num_cols]):
         with cols[opt_idx]:
-            display_url = option.get("preview_url") or option.get("image_url")
+            display_url = option.preview_url or option.image_url
             if display_url:
                 st.image(display_url, use_container_width=True)
 
-            st.caption(f"{option['album_name'][:25]}...")
-            st.caption(f"**{option['type']}**")
+            st.caption(option_captions[opt_idx])
+            st.caption(f"**{option.type}**")
 
-            img_data = download_image(option.get("image_url"))
-            filename = f"{result['artist']}_{track_part}_{opt_idx + 1}.jpg".replace("/", "_")
+            image_url = option.image_url
+            filename = f"{filename_stem}_{opt_idx + 1}.jpg"
 
-            if img_data:
+            if image_url not in prepared_images:
+                st.button(
+                    "📦 Prepare Download",
+                    key=f"prep_{result_index}_{opt_idx}",
+                    on_click=_prepare_download,
+                    args=(image_url,),
+                    use_container_width=True,
+                )
+            elif prepared_images[image_url]:
                 st.download_button(
                     label="⬇️ Download",
-                    data=img_data,
+                    data=prepared_images[image_url],
                     file_name=filename,
                     mime="image/jpeg",
                     key=f"dl_{result_index}_{opt_idx}",
@@ -604,7 +1114,7 @@ if st.session_state.get("results"):
 
     results = st.session_state["results"]
 
-    found_count = sum(1 for r in results if r.get("options"))
+    found_count = st.session_state["results_found"]
     col1, col2, col3 = st.columns(3)
     col1.metric("Total Entries", len(results))
     col2.metric("Found Artwork", found_count)
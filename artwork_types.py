@@ -0,0 +1,28 @@
+"""
+Shared result types for Music Artwork Finder.
+
+Kept out of app.py because Streamlit executes the script as a fresh __main__ module on
+every run: a class defined there is a new object each time, so st.cache_data could not
+pickle results built by another session's run. An importable module gives every run
+the same class.
+"""
+
+from typing import NamedTuple, Optional
+
+
+class ArtworkResult(NamedTuple):
+    """
+    One artwork option returned by a search.
+    A NamedTuple rather than a dict per result: smaller in session state and
+    attribute access in the gallery skips the key lookup.
+    """
+    source: str  # "Spotify" | "iTunes"
+    image_url: str  # Full-res image used for downloads
+    album_name: str
+    type: str  # "Artist Photo" | "Single" | "Album"
+    preview_url: str = ""  # Smaller rendition for thumbnails, when the source has one
+    width: Optional[int] = None
+    height: Optional[int] = None
+    artist_name: str = ""
+    track_name: str = ""
+    found: bool = True